@@ -4,14 +4,48 @@ Validation script for repository configuration and structure.
 Performs basic audits and checks as mentioned in the automation recommendations.
 """
 
+import os
 import sys
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def scan_paths(repo_root: Path, paths: list) -> dict:
+    """Resolve relative paths with a single directory scan per parent.
+
+    Returns a mapping of each path to its ``os.DirEntry``, or ``None`` when
+    the path does not exist.
+    """
+    names_by_parent = {}
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        names_by_parent.setdefault(parent, []).append(name)
+
+    entries = {}
+    for parent, names in names_by_parent.items():
+        try:
+            with os.scandir(repo_root / parent) as it:
+                present = {entry.name: entry for entry in it}
+        except OSError:
+            present = {}
+        for name in names:
+            path = f"{parent}/{name}" if parent else name
+            entries[path] = present.get(name)
+
+    return entries
+
+
+def read_lowercase(path: Path):
+    """Return the lowercased text of a file, or None if it does not exist."""
+    try:
+        return path.read_text().lower()
+    except FileNotFoundError:
+        return None
+
 
 def validate_repository_structure():
     """Validate that the repository has the expected structure."""
-    repo_root = Path(__file__).parent.parent
-
     required_dirs = ["scripts", "tests", ".github/workflows"]
 
     required_files = [
@@ -25,18 +59,20 @@ def validate_repository_structure():
 
     print("🔍 Validating repository structure...")
 
+    entries = scan_paths(REPO_ROOT, required_dirs + required_files)
+
     # Check directories
     for dir_path in required_dirs:
-        full_path = repo_root / dir_path
-        if not full_path.exists():
+        entry = entries[dir_path]
+        if entry is None or not entry.is_dir():
             print(f"❌ Missing required directory: {dir_path}")
             return False
         print(f"✅ Directory exists: {dir_path}")
 
     # Check files
     for file_path in required_files:
-        full_path = repo_root / file_path
-        if not full_path.exists():
+        entry = entries[file_path]
+        if entry is None or not entry.is_file():
             print(f"❌ Missing required file: {file_path}")
             return False
         print(f"✅ File exists: {file_path}")
@@ -46,21 +82,18 @@ def validate_repository_structure():
 
 def validate_dependencies():
     """Validate that requirements.txt contains expected dependencies."""
-    repo_root = Path(__file__).parent.parent
-    requirements_file = repo_root / "requirements.txt"
+    content = read_lowercase(REPO_ROOT / "requirements.txt")
 
-    if not requirements_file.exists():
+    if content is None:
         print("❌ requirements.txt not found")
         return False
 
-    content = requirements_file.read_text()
-
     required_packages = ["pytest", "flake8", "black", "Pillow"]
 
     print("🔍 Validating dependencies...")
 
     for package in required_packages:
-        if package.lower() not in content.lower():
+        if package.lower() not in content:
             print(f"❌ Missing required package: {package}")
             return False
         print(f"✅ Package found: {package}")
@@ -70,18 +103,16 @@ def validate_dependencies():
 
 def validate_workflows():
     """Validate that GitHub workflows have required components."""
-    repo_root = Path(__file__).parent.parent
-    workflows_dir = repo_root / ".github" / "workflows"
+    workflows_dir = REPO_ROOT / ".github" / "workflows"
 
     print("🔍 Validating GitHub workflows...")
 
     # Check CI workflow
-    ci_file = workflows_dir / "ci.yml"
-    if not ci_file.exists():
+    ci_content = read_lowercase(workflows_dir / "ci.yml")
+    if ci_content is None:
         print("❌ CI workflow missing")
         return False
 
-    ci_content = ci_file.read_text()
     ci_requirements = [
         "install dependencies",
         "flake8",
@@ -91,23 +122,22 @@ def validate_workflows():
     ]
 
     for requirement in ci_requirements:
-        if requirement.lower() not in ci_content.lower():
+        if requirement.lower() not in ci_content:
             print(f"❌ CI workflow missing: {requirement}")
             return False
 
     print("✅ CI workflow validation passed")
 
     # Check CD workflow
-    cd_file = workflows_dir / "cd.yml"
-    if not cd_file.exists():
+    cd_content = read_lowercase(workflows_dir / "cd.yml")
+    if cd_content is None:
         print("❌ CD workflow missing")
         return False
 
-    cd_content = cd_file.read_text()
     cd_requirements = ["generate icons", "commit", "github pages"]
 
     for requirement in cd_requirements:
-        if requirement.lower() not in cd_content.lower():
+        if requirement.lower() not in cd_content:
             print(f"❌ CD workflow missing: {requirement}")
             return False
 
@@ -0,0 +1,60 @@
+"""
+Tests for the repository validation script.
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import validate  # noqa: E402
+
+
+class TestScanPaths:
+    """Test cases for batched path resolution."""
+
+    def test_scan_paths_finds_files_and_directories(self, tmp_path):
+        """Test that scan_paths resolves top-level and nested paths."""
+        (tmp_path / "scripts").mkdir()
+        (tmp_path / "scripts" / "tool.py").write_text("# tool")
+        (tmp_path / "requirements.txt").write_text("pytest")
+
+        entries = validate.scan_paths(
+            tmp_path, ["scripts", "requirements.txt", "scripts/tool.py"]
+        )
+
+        assert entries["scripts"].is_dir()
+        assert entries["requirements.txt"].is_file()
+        assert entries["scripts/tool.py"].is_file()
+
+    def test_scan_paths_reports_missing_paths(self, tmp_path):
+        """Test that missing files and missing parents map to None."""
+        (tmp_path / "scripts").mkdir()
+
+        entries = validate.scan_paths(
+            tmp_path, ["scripts/missing.py", ".github/workflows/ci.yml"]
+        )
+
+        assert entries["scripts/missing.py"] is None
+        assert entries[".github/workflows/ci.yml"] is None
+
+
+class TestReadLowercase:
+    """Test cases for lowercased file reads."""
+
+    def test_read_lowercase_returns_lowercased_text(self, tmp_path):
+        """Test that read_lowercase lowercases the file content."""
+        requirements_file = tmp_path / "requirements.txt"
+        requirements_file.write_text("Pillow>=9.0.0\n")
+
+        assert validate.read_lowercase(requirements_file) == "pillow>=9.0.0\n"
+
+    def test_read_lowercase_missing_file(self, tmp_path):
+        """Test that read_lowercase returns None for a missing file."""
+        assert validate.read_lowercase(tmp_path / "missing.yml") is None
+
+
+def test_validate_repository_structure():
+    """Test that the repository passes its own structure validation."""
+    assert validate.validate_repository_structure()